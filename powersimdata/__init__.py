@@ -1,2 +1,17 @@
-from powersimdata.input.grid import Grid  # noqa: F401
-from powersimdata.scenario.scenario import Scenario  # noqa: F401
+def __getattr__(name):
+    """Import the public classes on first access, so that importing a submodule
+    does not load the whole package.
+
+    :param str name: attribute name.
+    :return: (*type*) -- the requested class.
+    :raises AttributeError: if the attribute does not exist.
+    """
+    if name == "Grid":
+        from powersimdata.input.grid import Grid
+
+        return Grid
+    if name == "Scenario":
+        from powersimdata.scenario.scenario import Scenario
+
+        return Scenario
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+
+
+class ChecksumCache:
+    """Persist file checksums on disk, invalidated when the size or modification
+    time of the file changes.
+
+    :param str cache_dir: directory where entries are stored.
+    """
+
+    def __init__(self, cache_dir=None):
+        """Constructor"""
+        if cache_dir is None:
+            cache_dir = os.path.join(
+                os.path.expanduser("~"), ".cache", "powersimdata", "checksums"
+            )
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, path):
+        """Get the location of the cache entry for a file.
+
+        :param str path: identifier of the file, e.g. host and full path.
+        :return: (*str*) -- path to the json entry
+        """
+        key = hashlib.sha256(path.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _load(self, path):
+        """Read the cache entry of a file.
+
+        :param str path: identifier of the file, e.g. host and full path.
+        :return: (*dict* or *NoneType*) -- the entry, or None if not found
+        """
+        try:
+            with open(self._entry_path(path)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def get(self, path, stat):
+        """Retrieve the checksum of a file if it is unchanged since it was cached.
+
+        :param str path: identifier of the file, e.g. host and full path.
+        :param stat: object with *st_size* and *st_mtime* attributes describing
+            the current state of the file.
+        :return: (*str* or *NoneType*) -- the cached checksum if valid, or None
+        """
+        entry = self._load(path)
+        if entry is None:
+            return None
+        if entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            return entry["checksum"]
+        return None
+
+    def get_stat(self, path, checksum):
+        """Retrieve the size and modification time of a file when the given
+        checksum was cached.
+
+        :param str path: identifier of the file, e.g. host and full path.
+        :param str checksum: the checksum to look up.
+        :return: (*tuple* or *NoneType*) -- size and modification time, or None if
+            the checksum is not the cached one
+        """
+        entry = self._load(path)
+        if entry is None or entry["checksum"] != checksum:
+            return None
+        return entry["size"], entry["mtime"]
+
+    def put(self, path, stat, checksum):
+        """Add or set the checksum of a file.
+
+        :param str path: identifier of the file, e.g. host and full path.
+        :param stat: object with *st_size* and *st_mtime* attributes describing
+            the state of the file the checksum was computed from.
+        :param str checksum: the checksum to cache
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = {"size": stat.st_size, "mtime": stat.st_mtime, "checksum": checksum}
+        with open(self._entry_path(path), "w") as f:
+            json.dump(entry, f)
@@ -1,6 +1,5 @@
 import functools
 import os
-import shutil
 from pathlib import Path
 from tempfile import mkstemp
 
@@ -8,6 +7,8 @@ import pandas as pd
 
 from powersimdata.utility import server_setup
 
+_tables = {}
+
 
 def verify_hash(func):
     """Utility function which verifies the sha1sum of the file before writing
@@ -18,6 +19,8 @@ def verify_hash(func):
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         checksum = self.data_access.checksum(self._FILE_NAME)
+        # edit the current version, not a cached one that may predate the checksum
+        self.invalidate()
         table = func(self, *args, **kwargs)
         self.commit(table, checksum)
         return table
@@ -38,9 +41,41 @@ class CsvStore:
 
     def get_table(self):
         """Read the given file from the server, falling back to local copy if
-        unable to connect.
+        unable to connect. The table is fetched once and cached until
+        :meth:`invalidate` is called or the table is modified.
+
+        :return: (*pandas.DataFrame*) -- the specified table as a data frame.
+        """
+        return self._get_cached_table().copy()
+
+    def _get_cached_table(self):
+        """Get the cached table, reading it first if needed. The data frame is
+        shared by all stores and must not be modified.
+
+        :return: (*pandas.DataFrame*) -- the specified table as a data frame.
+        """
+        key = self._cache_key()
+        if key not in _tables:
+            _tables[key] = self._read_table()
+        return _tables[key]
+
+    def invalidate(self):
+        """Drop the cached table so that the next read fetches it again."""
+        _tables.pop(self._cache_key(), None)
+
+    def _cache_key(self):
+        """Get the key identifying the table among all data stores.
+
+        :return: (*tuple*) -- data access type, root and file name.
+        """
+        root = getattr(self.data_access, "root", None)
+        return type(self.data_access).__name__, root, self._FILE_NAME
+
+    def _read_table(self):
+        """Download the table, falling back to local copy if unable to connect.
 
         :return: (*pandas.DataFrame*) -- the specified table as a data frame.
+        :raises FileNotFoundError: if no local copy is found.
         """
         filename = self._FILE_NAME
         local_path = Path(server_setup.LOCAL_DIR, filename)
@@ -74,11 +109,16 @@ class CsvStore:
         :param pandas.DataFrame table: the data frame to save
         :param str checksum: the checksum prior to download
         """
+        # render once, then write both the upload and the local copy
+        content = table.to_csv()
         tmp_file, tmp_path = mkstemp(dir=server_setup.LOCAL_DIR)
-        table.to_csv(tmp_path)
-        shutil.copy(tmp_path, os.path.join(server_setup.LOCAL_DIR, self._FILE_NAME))
-        os.close(tmp_file)
+        with os.fdopen(tmp_file, "w", newline="", encoding="utf-8") as f:
+            f.write(content)
+        local_path = os.path.join(server_setup.LOCAL_DIR, self._FILE_NAME)
+        with open(local_path, "w", newline="", encoding="utf-8") as f:
+            f.write(content)
         tmp_name = os.path.basename(tmp_path)
+        self.invalidate()
         self.data_access.push(tmp_name, checksum, change_name_to=self._FILE_NAME)
         if os.path.exists(tmp_path):  # only required if data_access is LocalDataAccess
             os.remove(tmp_path)
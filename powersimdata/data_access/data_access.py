@@ -1,25 +1,114 @@
+import atexit
+import ctypes
+import ctypes.util
+import fnmatch
 import glob
+import hashlib
+import mmap
 import operator
 import os
 import posixpath
+import shlex
 import shutil
+import socket
+import sys
+import threading
 import time
+import uuid
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from subprocess import Popen
 from tempfile import mkstemp
 
 import paramiko
 from tqdm import tqdm
 
+from powersimdata.data_access.checksum_cache import ChecksumCache
 from powersimdata.data_access.profile_helper import ProfileHelper
 from powersimdata.utility import server_setup
 from powersimdata.utility.helpers import CommandBuilder
 
+BUFFER_SIZE = 1 << 20
+PREFETCH_SIZE = 64 << 20
+COMMAND_TIMEOUT = 3600
+
 _dirs = {
     "tmp": (server_setup.EXECUTE_DIR,),
     "input": server_setup.INPUT_DIR,
     "output": server_setup.OUTPUT_DIR,
 }
 
+_checksum_cache = ChecksumCache()
+
+_FICLONE = 0x40049409
+_reflink_supported = None
+
+_ssh_pool = {}
+_ssh_pool_lock = threading.Lock()
+
+
+def _pool_key():
+    return (
+        server_setup.get_server_user(),
+        server_setup.SERVER_ADDRESS,
+        server_setup.SERVER_SSH_PORT,
+    )
+
+
+def _is_active(client):
+    transport = client.get_transport()
+    return transport is not None and transport.is_active()
+
+
+def _acquire_client():
+    """Take an authenticated ssh client from the pool.
+
+    :return: (*paramiko.SSHClient*) -- a live client, or None if none is available
+    """
+    if not _ssh_pool:
+        return None
+    with _ssh_pool_lock:
+        clients = _ssh_pool.get(_pool_key(), deque())
+        while clients:
+            client = clients.pop()
+            if _is_active(client):
+                return client
+            client.close()
+    return None
+
+
+def _release_client(client):
+    """Return an ssh client to the pool, or close it if the connection dropped.
+
+    :param paramiko.SSHClient client: the client to release
+    """
+    if not _is_active(client):
+        client.close()
+        return
+    with _ssh_pool_lock:
+        _ssh_pool.setdefault(_pool_key(), deque()).append(client)
+
+
+def _release_session(client, channels):
+    """Close the channels opened on an ssh client, then return it to the pool.
+
+    :param paramiko.SSHClient client: the client to release
+    :param list channels: sftp clients and shell sessions opened on the client
+    """
+    while channels:
+        channels.pop().close()
+    _release_client(client)
+
+
+@atexit.register
+def _drain_pool():
+    """Close all pooled ssh clients."""
+    with _ssh_pool_lock:
+        for clients in _ssh_pool.values():
+            while clients:
+                clients.pop().close()
+
 
 class DataAccess:
     """Interface to a local or remote data store."""
@@ -49,6 +138,16 @@ class DataAccess:
         """
         raise NotImplementedError
 
+    def copy_many_from_parallel(self, file_names, from_dir=None, max_workers=4):
+        """Copy several files from data store to userspace concurrently.
+
+        :param list file_names: file names to copy.
+        :param str from_dir: data store directory to copy files from.
+        :param int max_workers: maximum number of concurrent transfers.
+        """
+        for file_name in file_names:
+            self.copy_from(file_name, from_dir)
+
     def get_base_dir(self, kind, backup=False):
         """Get path to given kind relative to instance root
 
@@ -149,12 +248,13 @@ class DataAccess:
         """
         raise NotImplementedError
 
-    def push(self, file_name, checksum, change_name_to=None):
+    def push(self, file_name, checksum, change_name_to=None, strict=False):
         """Push the file from local to remote root folder, ensuring integrity
 
         :param str file_name: the file name, located at the local root
         :param str checksum: the checksum prior to download
         :param str change_name_to: new name for file when copied to data store.
+        :param bool strict: always compare checksums to detect conflicts.
         """
         raise NotImplementedError
 
@@ -188,23 +288,38 @@ class LocalDataAccess(DataAccess):
         """
         pass
 
-    def push(self, file_name, checksum, change_name_to=None):
+    def push(self, file_name, checksum, change_name_to=None, strict=False):
         """Nothing to be done due to symlink
 
         :param str file_name: the file name, located at the local root
         :param str checksum: the checksum prior to download
         :param str change_name_to: new name for file when copied to data store.
+        :param bool strict: ignored
         """
         pass
 
     def checksum(self, relative_path):
-        """Return dummy value since this is only required for remote
-        environment
+        """Return the checksum of the file path, in the same format as sha1sum,
+        reusing the cached value if the file size and modification time are
+        unchanged
 
         :param str relative_path: path relative to root
         :return: (*str*) -- the checksum of the file
         """
-        return "dummy_value"
+        full_path = self.join(self.root, relative_path)
+        stat = os.stat(full_path)
+        checksum = _checksum_cache.get(full_path, stat)
+        if checksum is not None:
+            return checksum
+
+        sha1 = hashlib.sha1()
+        if stat.st_size > 0:
+            with open(full_path, "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sha1.update(mm)
+        checksum = f"{sha1.hexdigest()}  {full_path}"
+        _checksum_cache.put(full_path, stat, checksum)
+        return checksum
 
     def move_to(self, file_name, to_dir, change_name_to=None):
         """Copy a file from userspace to data store.
@@ -230,10 +345,17 @@ class LocalDataAccess(DataAccess):
         os.makedirs(full_path, exist_ok=True)
 
     @staticmethod
-    def _fapply(func, pattern):
-        files = [f for f in glob.glob(pattern) if os.path.isfile(f)]
-        for f in files:
-            func(f)
+    def _fapply(func, pattern, max_workers=1, prefetch=False):
+        files = _list_files(pattern)
+        if prefetch:
+            for f in files:
+                _prefetch(f)
+        if max_workers == 1 or len(files) <= 1:
+            for f in files:
+                func(f)
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+            list(executor.map(func, files))
 
     def copy(self, src, dest, recursive=False, update=False):
         """Wrapper around cp command which creates dest path if needed
@@ -244,11 +366,14 @@ class LocalDataAccess(DataAccess):
         :param bool update: ignored
         """
         if recursive:
-            shutil.copytree(src, dest)
+            shutil.copytree(src, dest, copy_function=reflink_or_copy)
         else:
             self.makedir(dest)
-            func = lambda s: shutil.copy(s, dest)  # noqa: E731
-            LocalDataAccess._fapply(func, src)
+            func = lambda s: reflink_or_copy(s, dest)  # noqa: E731
+            # copies are bound by file system latency, so overlap them, and queue
+            # the reads of all files at once unless clones spare reading them
+            prefetch = _reflink_supported is False
+            LocalDataAccess._fapply(func, src, max_workers=32, prefetch=prefetch)
 
     def remove(self, target, recursive=False, confirm=True):
         """Remove target using rm semantics
@@ -277,7 +402,7 @@ class LocalDataAccess(DataAccess):
         """
         blob_version = super().get_profile_version(grid_model, kind)
         local_version = ProfileHelper.get_profile_version_local(grid_model, kind)
-        return list(set(blob_version + local_version))
+        return list(set(blob_version).union(local_version))
 
     def _exists(self, filepath):
         """Return whether the file exists
@@ -297,6 +422,11 @@ class SSHDataAccess(DataAccess):
         """Constructor"""
         super().__init__(root, backup_root)
         self._ssh = None
+        self._sftp = None
+        self._shell = None
+        self._channels = []
+        self._finalizer = None
+        self._known_dirs = set()
         self._retry_after = 5
         self.local_root = server_setup.LOCAL_DIR
         self.description = "server"
@@ -304,13 +434,18 @@ class SSHDataAccess(DataAccess):
 
     @property
     def ssh(self):
-        """Get or create the ssh connection object, with attempts rate limited.
+        """Get the ssh connection object, reusing a pooled one if available, or
+        create it, with attempts rate limited.
 
         :raises IOError: if connection failed or still within retry window
         :return: (*paramiko.SSHClient*) -- the client instance
         """
         should_attempt = time.time() - SSHDataAccess._last_attempt > self._retry_after
 
+        if self._ssh is None:
+            client = _acquire_client()
+            if client is not None:
+                self._use_client(client)
         if self._ssh is None:
             if should_attempt:
                 try:
@@ -323,6 +458,41 @@ class SSHDataAccess(DataAccess):
 
         return self._ssh
 
+    @property
+    def sftp(self):
+        """Get or create the sftp client, reused across transfers.
+
+        :return: (*paramiko.SFTPClient*) -- the client instance
+        """
+        if self._sftp is None:
+            self._sftp = self.ssh.open_sftp()
+            self._channels.append(self._sftp)
+        return self._sftp
+
+    @property
+    def shell(self):
+        """Get or create the remote shell session, reused across commands.
+
+        :return: (*RemoteShell*) -- the shell instance
+        """
+        if self._shell is None or self._shell.closed:
+            self._shell = RemoteShell(self.ssh)
+            self._channels.append(self._shell)
+        return self._shell
+
+    def _use_client(self, client):
+        """Use the given ssh client, which goes back to the pool when this object
+        is closed or garbage collected.
+
+        :param paramiko.SSHClient client: the connected client
+        """
+        self._ssh = client
+        self._finalizer = weakref.finalize(
+            self, _release_session, client, self._channels
+        )
+        # pooled clients are closed at exit, the others with the process
+        self._finalizer.atexit = False
+
     def _setup_server_connection(self):
         """This function setup the connection to the server."""
         client = paramiko.SSHClient()
@@ -346,9 +516,27 @@ class SSHDataAccess(DataAccess):
             username=server_user,
             port=server_setup.SERVER_SSH_PORT,
             timeout=10,
+            compress=True,
+            sock=self._open_socket(),
         )
 
-        self._ssh = client
+        self._use_client(client)
+
+    @staticmethod
+    def _open_socket():
+        """Open a tcp socket to the server with Nagle's algorithm disabled. Buffer
+        sizes are left to the kernel autotuning.
+
+        :return: (*socket.socket*) -- the connected socket
+        """
+        address = (server_setup.SERVER_ADDRESS, server_setup.SERVER_SSH_PORT)
+        sock = socket.create_connection(address, timeout=10)
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            sock.close()
+            raise
+        return sock
 
     def copy_from(self, file_name, from_dir=None):
         """Copy a file from data store to userspace.
@@ -365,15 +553,36 @@ class SSHDataAccess(DataAccess):
         to_path = os.path.join(to_dir, file_name)
         self._check_file_exists(from_path, should_exist=True)
 
-        with self.ssh.open_sftp() as sftp:
-            print(f"Transferring {file_name} from server")
-            cbk, bar = progress_bar(ascii=True, unit="b", unit_scale=True)
-            tmp_file, tmp_path = mkstemp()
-            sftp.get(from_path, tmp_path, callback=cbk)
+        print(f"Transferring {file_name} from server")
+        cbk, bar = progress_bar(ascii=True, unit="b", unit_scale=True)
+        try:
+            self._download(self.sftp, from_path, to_path, callback=cbk)
+        finally:
             bar.close()
-            os.close(tmp_file)
-        # wait for file handle to be available
-        shutil.move(tmp_path, to_path)
+
+    @staticmethod
+    def _download(sftp, from_path, to_path, callback=None):
+        """Download a file through the given sftp client.
+
+        :param paramiko.SFTPClient sftp: the client to use.
+        :param str from_path: full path on the server.
+        :param str to_path: full local path.
+        :param callable callback: optional progress function, see
+            :func:`copy_stream`.
+        """
+        # download next to the destination so the final rename stays on one
+        # filesystem
+        tmp_file, tmp_path = mkstemp(dir=os.path.dirname(to_path))
+        try:
+            with os.fdopen(tmp_file, "wb") as local:
+                with sftp.open(from_path, "rb") as remote:
+                    file_size = remote.stat().st_size
+                    remote.prefetch(file_size)
+                    copy_stream(remote, local, callback=callback, total=file_size)
+            os.replace(tmp_path, to_path)
+        except:  # noqa
+            os.remove(tmp_path)
+            raise
 
     def move_to(self, file_name, to_dir=None, change_name_to=None):
         """Copy a file from userspace to data store.
@@ -397,12 +606,69 @@ class SSHDataAccess(DataAccess):
         self.makedir(to_dir)
         self._check_file_exists(to_path, should_exist=False)
 
-        with self.ssh.open_sftp() as sftp:
-            print(f"Transferring {file_name} to server")
-            sftp.put(from_path, to_path)
+        print(f"Transferring {file_name} to server")
+        with open(from_path, "rb") as local:
+            with self.sftp.open(to_path, "wb") as remote:
+                remote.set_pipelined(True)
+                size = copy_stream(local, remote)
+        if self.sftp.stat(to_path).st_size != size:
+            raise IOError(f"Size mismatch after transferring {file_name} to server")
 
         os.remove(from_path)
 
+    def copy_many_from_parallel(self, file_names, from_dir=None, max_workers=4):
+        """Copy several files from data store to userspace, transferred
+        concurrently over separate sftp channels of the ssh connection.
+
+        :param list file_names: file names to copy.
+        :param str from_dir: data store directory to copy files from.
+        :param int max_workers: maximum number of concurrent transfers.
+        """
+        for file_name in file_names:
+            self._check_filename(file_name)
+        from_dir = "" if from_dir is None else from_dir
+        to_dir = os.path.join(self.local_root, from_dir)
+        os.makedirs(to_dir, exist_ok=True)
+
+        print(f"Transferring {len(file_names)} files from server")
+        bar = tqdm(ascii=True, unit="b", unit_scale=True)
+        lock = threading.Lock()
+        ssh = self.ssh
+
+        def download(file_name):
+            last = [0]
+
+            def show(transferred, total):
+                with lock:
+                    bar.update(transferred - last[0])
+                last[0] = transferred
+
+            sftp = ssh.open_sftp()
+            try:
+                self._download(
+                    sftp,
+                    self.join(self.root, from_dir, file_name),
+                    os.path.join(to_dir, file_name),
+                    callback=show,
+                )
+            finally:
+                sftp.close()
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(download, file_names))
+        finally:
+            bar.close()
+
+    def execute_command(self, command):
+        """Execute a command on the server and wait for completion.
+
+        :param str command: command to run in the remote shell session.
+        :return: (*tuple*) -- list of stdout lines and list of stderr lines
+        """
+        _, stdout, stderr = self.shell.run(command)
+        return stdout, stderr
+
     def execute_command_async(self, command):
         """Execute a command via ssh, without waiting for completion.
 
@@ -416,47 +682,77 @@ class SSHDataAccess(DataAccess):
         return process
 
     def checksum(self, relative_path):
-        """Return the checksum of the file path (using sha1sum)
+        """Return the checksum of the file path (using sha1sum), reusing the
+        cached value if the file size and modification time are unchanged
 
         :param str relative_path: path relative to root
+        :raises OSError: if the file does not exist
         :return: (*str*) -- the checksum of the file
         """
         full_path = self.join(self.root, relative_path)
-        self._check_file_exists(full_path)
+        try:
+            stat = self.sftp.stat(full_path)
+        except IOError:
+            raise OSError(f"{full_path} not found on {self.description}")
+
+        cache_key = f"{server_setup.SERVER_ADDRESS}:{full_path}"
+        checksum = _checksum_cache.get(cache_key, stat)
+        if checksum is not None:
+            return checksum
 
         command = f"sha1sum {full_path}"
-        _, stdout, _ = self.ssh.exec_command(command)
-        lines = stdout.readlines()
-        return lines[0].strip()
+        lines, _ = self.execute_command(command)
+        checksum = lines[0].strip()
+        _checksum_cache.put(cache_key, stat, checksum)
+        return checksum
 
-    def push(self, file_name, checksum, change_name_to=None):
-        """Push file to server and verify the checksum matches a prior value
+    def push(self, file_name, checksum, change_name_to=None, strict=False):
+        """Push file to server and verify the checksum matches a prior value.
+        Unless strict, the file is considered unchanged without hashing it if its
+        size and modification time match those recorded with the checksum
 
         :param str file_name: the file name, located at the local root
         :param str checksum: the checksum prior to download
         :param str change_name_to: new name for file when copied to data store.
+        :param bool strict: always compare checksums to detect conflicts.
         :raises IOError: if command generated stderr
         """
         new_name = file_name if change_name_to is None else change_name_to
         backup = f"{new_name}.temp"
-        self.move_to(file_name, change_name_to=backup)
+        original = self.join(self.root, new_name)
+
+        prev_stat = None
+        if not strict:
+            cache_key = f"{server_setup.SERVER_ADDRESS}:{original}"
+            prev_stat = _checksum_cache.get_stat(cache_key, checksum)
 
         values = {
-            "original": self.join(self.root, new_name),
+            "original": original,
             "updated": self.join(self.root, backup),
             "lockfile": self.join(self.root, "scenario.lockfile"),
             "checksum": checksum,
+            "stat": "" if prev_stat is None else "%d:%d" % prev_stat,
         }
 
+        # the server hashes the original (unless size and mtime show it is
+        # unchanged) while the update is uploaded, and only renames once the
+        # upload is acknowledged on stdin
         template = "(flock -x 200; \
                 prev='{checksum}'; \
-                curr=$(sha1sum {original}); \
-                if [[ $prev == $curr ]]; then mv {updated} {original} -b; \
+                if [[ $(stat -c %s:%Y {original}) == '{stat}' ]]; then curr=$prev; \
+                else curr=$(sha1sum {original}); fi; \
+                read uploaded; \
+                if [[ $prev == $curr && $uploaded == done ]]; then mv {updated} {original} -b; \
                 else echo CONFLICT_ERROR 1>&2; fi) \
                 200>{lockfile}"
 
         command = template.format(**values)
-        _, _, stderr = self.ssh.exec_command(command)
+        stdin, _, stderr = self.ssh.exec_command(command)
+        try:
+            self.move_to(file_name, change_name_to=backup)
+            stdin.write(b"done\n")
+        finally:
+            stdin.close()
 
         errors = stderr.readlines()
         if len(errors) > 0:
@@ -465,15 +761,17 @@ class SSHDataAccess(DataAccess):
             raise IOError("Failed to push file - most likely a conflict was detected.")
 
     def makedir(self, full_path):
-        """Create path on server
+        """Create path on server, unless already created by this instance
 
         :param str full_path: the path, excluding filename
         :raises IOError: if command generated stderr
         """
-        _, _, stderr = self.ssh.exec_command(f"mkdir -p {full_path}")
-        errors = stderr.readlines()
+        if full_path in self._known_dirs:
+            return
+        _, errors = self.execute_command(f"mkdir -p {full_path}")
         if len(errors) > 0:
             raise IOError(f"Failed to create {full_path} on server")
+        self._known_dirs.add(full_path)
 
     def copy(self, src, dest, recursive=False, update=False):
         """Wrapper around cp command which creates dest path if needed
@@ -486,8 +784,8 @@ class SSHDataAccess(DataAccess):
         """
         self.makedir(dest)
         command = CommandBuilder.copy(src, dest, recursive, update)
-        _, _, stderr = self.ssh.exec_command(command)
-        if len(stderr.readlines()) != 0:
+        _, errors = self.execute_command(command)
+        if len(errors) != 0:
             raise IOError(f"Failed to execute {command}")
 
     def remove(self, target, recursive=False, confirm=True):
@@ -504,8 +802,10 @@ class SSHDataAccess(DataAccess):
             if confirmed.lower() != "y":
                 print("Operation cancelled.")
                 return
-        _, _, stderr = self.ssh.exec_command(command)
-        if len(stderr.readlines()) != 0:
+        # the target may contain directories created earlier
+        self._known_dirs.clear()
+        _, errors = self.execute_command(command)
+        if len(errors) != 0:
             raise IOError(f"Failed to delete target={target} on server")
         print("--> Done!")
 
@@ -515,13 +815,256 @@ class SSHDataAccess(DataAccess):
         :param str filepath: the path to the file
         :return: (*bool*) -- whether the file exists
         """
-        _, _, stderr = self.ssh.exec_command(f"ls {filepath}")
-        return len(stderr.readlines()) == 0
+        try:
+            self.sftp.stat(filepath)
+        except IOError:
+            return False
+        return True
 
     def close(self):
-        """Close the connection if one is open"""
+        """Release the connection to the pool if one is open"""
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
         if self._ssh is not None:
-            self._ssh.close()
+            _release_session(self._ssh, self._channels)
+            self._ssh = None
+        self._sftp = None
+        self._shell = None
+
+
+class RemoteShell:
+    """Run commands one after the other in a single long-lived bash session on
+    the server, avoiding a new ssh session per command.
+
+    :param paramiko.SSHClient client: the connected client
+    :param int timeout: seconds to wait for output before giving up on a command.
+    """
+
+    def __init__(self, client, timeout=COMMAND_TIMEOUT):
+        """Constructor"""
+        self._stdin, self._stdout, self._stderr = client.exec_command(
+            "bash", timeout=timeout
+        )
+        self._sentinel = f"__END_{uuid.uuid4().hex}__"
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def _read_until_sentinel(self, stream):
+        """Read lines until the sentinel is found.
+
+        :param stream: file object to read from.
+        :raises IOError: if the session ended before the sentinel
+        :return: (*tuple*) -- list of lines read and the text following the sentinel
+        """
+        lines = []
+        while True:
+            line = stream.readline()
+            if len(line) == 0:
+                raise IOError("Remote shell session closed unexpectedly")
+            position = line.find(self._sentinel)
+            if position >= 0:
+                if position > 0:
+                    lines.append(line[:position])
+                return lines, line[position + len(self._sentinel) :].strip()
+            lines.append(line)
+
+    def run(self, command):
+        """Run a command and wait for completion. The command is evaluated from a
+        quoted string, so that a syntax error fails the command alone, and does
+        not read the session input.
+
+        :param str command: the command to run.
+        :raises IOError: if the session is closed or the command timed out
+        :return: (*tuple*) -- exit status, list of stdout lines and list of
+            stderr lines
+        """
+        with self._lock:
+            if self.closed:
+                raise IOError("Remote shell session is closed")
+            try:
+                self._stdin.write(
+                    f"eval {shlex.quote(command)} < /dev/null\n"
+                    f"echo {self._sentinel}$?; echo {self._sentinel} 1>&2\n"
+                )
+                self._stdin.flush()
+                stdout, status = self._read_until_sentinel(self._stdout)
+                stderr, _ = self._read_until_sentinel(self._stderr)
+            except socket.timeout:
+                # the session state is unknown, a new one is needed
+                self._close()
+                raise IOError(f"Timed out running {command} on server")
+            except IOError:
+                self._close()
+                raise
+        return int(status), stdout, stderr
+
+    def _close(self):
+        self.closed = True
+        self._stdin.close()
+
+    def close(self):
+        """End the session."""
+        with self._lock:
+            if not self.closed:
+                self._close()
+
+
+def _reflink(src, dest):
+    """Create a copy-on-write clone of a file.
+
+    :param str src: path to the source file.
+    :param str dest: path to the clone, which must not be a directory.
+    :raises NotImplementedError: if the platform has no clone primitive
+    :raises OSError: if the file system does not support cloning
+    """
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        with open(src, "rb") as s, open(dest, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+    elif sys.platform == "darwin":
+        # clonefile refuses an existing destination, clone next to it and replace it
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        tmp = os.path.join(os.path.dirname(dest), f".{uuid.uuid4().hex}.tmp")
+        if libc.clonefile(os.fsencode(src), os.fsencode(tmp), 0) != 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), dest)
+        os.replace(tmp, dest)
+    else:
+        raise NotImplementedError
+
+
+def reflink_or_copy(src, dest):
+    """Copy a file like :func:`shutil.copy`, using a copy-on-write clone when the
+    file system supports it, or else an in-kernel copy. Clone support is determined
+    on the first attempt.
+
+    :param str src: path to the source file.
+    :param str dest: destination file or directory.
+    :raises shutil.SameFileError: if the destination is the source file
+    :return: (*str*) -- path to the copy
+    """
+    global _reflink_supported
+    if os.path.isdir(dest):
+        dest = os.path.join(dest, os.path.basename(src))
+    # opening the destination for writing would truncate the source
+    if os.path.exists(dest) and os.path.samefile(src, dest):
+        raise shutil.SameFileError(f"{src} and {dest} are the same file")
+    if _reflink_supported is not False:
+        try:
+            _reflink(src, dest)
+            shutil.copymode(src, dest)
+            _reflink_supported = True
+            return dest
+        except (OSError, NotImplementedError):
+            if _reflink_supported is None:
+                _reflink_supported = False
+    try:
+        _copy_in_kernel(src, dest)
+    except (OSError, NotImplementedError):
+        return shutil.copy(src, dest)
+    shutil.copymode(src, dest)
+    return dest
+
+
+def _copy_in_kernel(src, dest):
+    """Copy the content of a file without moving it through user space, with
+    copy_file_range where available and sendfile otherwise.
+
+    :param str src: path to the source file.
+    :param str dest: path to the copy, which must not be a directory.
+    :raises NotImplementedError: if the platform has neither primitive
+    :raises OSError: if the file system does not support the copy, or copied less
+        than the whole file
+    """
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is None and not sys.platform.startswith("linux"):
+        raise NotImplementedError
+    with open(src, "rb") as s, open(dest, "wb") as d:
+        infd, outfd = s.fileno(), d.fileno()
+        count = min(max(os.fstat(infd).st_size, BUFFER_SIZE), 1 << 30)
+        offset = 0
+        while True:
+            if copy_file_range is not None:
+                sent = copy_file_range(infd, outfd, count)
+            else:
+                sent = os.sendfile(outfd, infd, offset, count)
+            if sent == 0:
+                break
+            offset += sent
+        # some file systems report the end of file without copying anything
+        if offset != os.fstat(infd).st_size:
+            raise OSError(f"Copied {offset} bytes of {src}")
+
+
+def _prefetch(path):
+    """Ask the kernel to start reading the beginning of a file in the background,
+    sequential readahead taking over once it is copied.
+
+    :param str path: path to the file.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, PREFETCH_SIZE, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _list_files(pattern):
+    """List regular files matching a glob pattern. When only the file name holds
+    wildcards, the directory is read in a single pass and file types come from the
+    directory entries, sparing a stat call per match.
+
+    :param str pattern: path, with optional wildcards.
+    :return: (*list*) -- paths to the matching files.
+    """
+    dirname, basename = os.path.split(pattern)
+    if glob.has_magic(dirname):
+        return [f for f in glob.glob(pattern) if os.path.isfile(f)]
+    if not glob.has_magic(basename):
+        return [pattern] if os.path.isfile(pattern) else []
+    hidden = basename.startswith(".")
+    try:
+        with os.scandir(dirname or os.curdir) as it:
+            return [
+                os.path.join(dirname, e.name)
+                for e in it
+                if (hidden or not e.name.startswith("."))
+                and fnmatch.fnmatch(e.name, basename)
+                and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+
+
+def copy_stream(src, dst, callback=None, total=0):
+    """Copy the content of a file object to another in large blocks
+
+    :param src: readable file object.
+    :param dst: writable file object.
+    :param callable callback: optional function called with the number of bytes
+        transferred so far and ``total``.
+    :param int total: total number of bytes expected, passed to ``callback``.
+    :return: (*int*) -- number of bytes copied.
+    """
+    transferred = 0
+    while True:
+        data = src.read(BUFFER_SIZE)
+        if not data:
+            break
+        dst.write(data)
+        transferred += len(data)
+        if callback is not None:
+            callback(transferred, total)
+    return transferred
 
 
 def progress_bar(*args, **kwargs):
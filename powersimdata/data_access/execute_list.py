@@ -21,7 +21,7 @@ class ExecuteListManager(CsvStore):
         :raises Exception: if scenario not found in execute list.
         :return: (*str*) -- scenario status
         """
-        table = self.get_execute_table()
+        table = self._get_cached_table()
         try:
             return table.loc[int(scenario_id), "status"]
         except KeyError:
@@ -1,5 +1,7 @@
+import functools
 import json
 import os
+import time
 
 import requests
 from tqdm.auto import tqdm
@@ -9,6 +11,7 @@ from powersimdata.utility import server_setup
 
 class ProfileHelper:
     BASE_URL = "https://besciences.blob.core.windows.net/profiles"
+    VERSION_TTL = 600
 
     @staticmethod
     def get_file_components(scenario_info, field_name):
@@ -75,9 +78,9 @@ class ProfileHelper:
         :param str kind: *'demand'*, *'hydro'*, *'solar'* or *'wind'*.
         :return: (*list*) -- available profile version.
         """
-
-        resp = requests.get(f"{ProfileHelper.BASE_URL}/version.json")
-        return ProfileHelper.parse_version(grid_model, kind, resp.json())
+        # the cached response is reused for at most VERSION_TTL seconds
+        period = int(time.time() // ProfileHelper.VERSION_TTL)
+        return list(ProfileHelper._get_profile_version_cloud(grid_model, kind, period))
 
     @staticmethod
     def get_profile_version_local(grid_model, kind):
@@ -87,10 +90,33 @@ class ProfileHelper:
         :param str kind: *'demand'*, *'hydro'*, *'solar'* or *'wind'*.
         :return: (*list*) -- available profile version.
         """
-
         version_file = os.path.join(server_setup.LOCAL_DIR, "version.json")
-        if not os.path.exists(version_file):
+        try:
+            stat = os.stat(version_file)
+        except FileNotFoundError:
             return []
+        # keyed on the modification time so that edits to the file are picked up
+        return list(
+            ProfileHelper._get_profile_version_local(
+                version_file, stat.st_mtime_ns, stat.st_size, grid_model, kind
+            )
+        )
+
+    @staticmethod
+    def invalidate_profile_versions():
+        """Clear cached profile versions, e.g. after new profiles are added."""
+        ProfileHelper._get_profile_version_cloud.cache_clear()
+        ProfileHelper._get_profile_version_local.cache_clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_profile_version_cloud(grid_model, kind, period):
+        resp = requests.get(f"{ProfileHelper.BASE_URL}/version.json")
+        return tuple(ProfileHelper.parse_version(grid_model, kind, resp.json()))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _get_profile_version_local(version_file, mtime, size, grid_model, kind):
         with open(version_file) as f:
             version = json.load(f)
-            return ProfileHelper.parse_version(grid_model, kind, version)
+            return tuple(ProfileHelper.parse_version(grid_model, kind, version))
@@ -41,13 +41,14 @@ class ScenarioListManager(CsvStore):
             print(text)
             print("------------------")
 
-        table = self.get_scenario_table()
-        try:
-            matches = table.index.isin([int(descriptor)])
-        except ValueError:
-            matches = table[table.name == descriptor].index
-
-        scenario = table.loc[matches, :]
+        table = self._get_cached_table()
+        descriptor = str(descriptor)
+        if descriptor.isdecimal():
+            scenario_id = int(descriptor)
+            matches = [scenario_id] if scenario_id in table.index else []
+            scenario = table.loc[matches, :]
+        else:
+            scenario = table[table.name == descriptor]
         if scenario.shape[0] == 0:
             err_message("SCENARIO NOT FOUND")
         elif scenario.shape[0] > 1:
@@ -0,0 +1,28 @@
+from types import SimpleNamespace
+
+from powersimdata.data_access.checksum_cache import ChecksumCache
+
+
+def test_checksum_cache(tmp_path):
+    cache = ChecksumCache(str(tmp_path))
+    stat = SimpleNamespace(st_size=10, st_mtime=1600000000)
+    assert cache.get("host:/path/file.csv", stat) is None
+
+    cache.put("host:/path/file.csv", stat, "abc  /path/file.csv")
+    assert cache.get("host:/path/file.csv", stat) == "abc  /path/file.csv"
+    assert cache.get("host:/path/other.csv", stat) is None
+
+
+def test_checksum_cache_invalidated(tmp_path):
+    cache = ChecksumCache(str(tmp_path))
+    cache.put("foo", SimpleNamespace(st_size=10, st_mtime=1), "abc")
+    assert cache.get("foo", SimpleNamespace(st_size=11, st_mtime=1)) is None
+    assert cache.get("foo", SimpleNamespace(st_size=10, st_mtime=2)) is None
+
+
+def test_checksum_cache_get_stat(tmp_path):
+    cache = ChecksumCache(str(tmp_path))
+    assert cache.get_stat("foo", "abc") is None
+    cache.put("foo", SimpleNamespace(st_size=10, st_mtime=1), "abc")
+    assert cache.get_stat("foo", "abc") == (10, 1)
+    assert cache.get_stat("foo", "def") is None
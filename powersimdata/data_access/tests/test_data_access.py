@@ -1,11 +1,16 @@
+import hashlib
 import os
+import socket
+import shutil
 import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from powersimdata.data_access.data_access import SSHDataAccess
+from powersimdata.data_access import data_access as da
+from powersimdata.data_access.checksum_cache import ChecksumCache
+from powersimdata.data_access.data_access import LocalDataAccess, SSHDataAccess
 from powersimdata.tests.mock_ssh import MockConnection
 from powersimdata.utility import server_setup
 
@@ -30,7 +35,8 @@ def temp_fs(tmp_path):
 
 
 @pytest.fixture
-def mock_data_access(monkeypatch, temp_fs):
+def mock_data_access(monkeypatch, temp_fs, tmp_path):
+    monkeypatch.setattr(da, "_checksum_cache", ChecksumCache(tmp_path / "cache"))
     data_access = SSHDataAccess()
     monkeypatch.setattr(data_access, "_ssh", MockConnection())
     data_access.root = temp_fs[0]
@@ -154,3 +160,268 @@ def test_check_filename(mock_data_access):
         mock_data_access.copy_from("dir/foo.txt", "dir")
     with pytest.raises(ValueError):
         mock_data_access.move_to("dir/foo.txt", "asdf")
+
+
+def test_sftp_reused(mock_data_access):
+    assert mock_data_access.sftp is mock_data_access.sftp
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_push(mock_data_access, temp_fs, make_temp):
+    fname = make_temp()
+    checksum = mock_data_access.checksum(fname)
+    (temp_fs[1] / "updated").write_bytes(b"updated")
+    mock_data_access.push("updated", checksum, change_name_to=fname)
+    with open(os.path.join(temp_fs[0], fname), "rb") as f:
+        assert f.read() == b"updated"
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_push_conflict(mock_data_access, temp_fs, make_temp):
+    fname = make_temp()
+    (temp_fs[1] / "updated").write_bytes(b"updated")
+    with pytest.raises(IOError):
+        mock_data_access.push("updated", "outdated", change_name_to=fname)
+    _check_content(os.path.join(temp_fs[0], fname))
+
+
+def test_ssh_client_pool(monkeypatch):
+    class Transport:
+        active = True
+
+        def is_active(self):
+            return self.active
+
+    class Client(MockConnection):
+        transport = Transport()
+
+        def get_transport(self):
+            return self.transport
+
+    monkeypatch.setattr(da, "_ssh_pool", {})
+    monkeypatch.setattr(da, "_pool_key", lambda: ("user", "host", 22))
+    client = Client()
+    data_access = SSHDataAccess()
+    monkeypatch.setattr(data_access, "_ssh", client)
+    data_access.close()
+    data_access = SSHDataAccess()
+    assert data_access.ssh is client
+
+    # dropping the data access also returns the client to the pool
+    del data_access
+    data_access = SSHDataAccess()
+    assert data_access.ssh is client
+    data_access.close()
+
+    da._release_client(client)
+    client.transport.active = False
+    assert da._acquire_client() is None
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_checksum_cached(mock_data_access, monkeypatch, make_temp):
+    fname = make_temp()
+    checksum = mock_data_access.checksum(fname)
+
+    def fail(command):
+        raise AssertionError("checksum should be cached")
+
+    monkeypatch.setattr(mock_data_access, "execute_command", fail)
+    assert checksum == mock_data_access.checksum(fname)
+
+
+def test_check_file_exists(mock_data_access, make_temp):
+    fname = make_temp()
+    mock_data_access._check_file_exists(os.path.join(mock_data_access.root, fname))
+    with pytest.raises(OSError):
+        mock_data_access._check_file_exists(
+            os.path.join(mock_data_access.root, fname), should_exist=False
+        )
+    with pytest.raises(OSError):
+        mock_data_access._check_file_exists(
+            os.path.join(mock_data_access.root, "missing")
+        )
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_push_strict(mock_data_access, temp_fs, make_temp):
+    fname = make_temp()
+    checksum = mock_data_access.checksum(fname)
+    (temp_fs[1] / "updated").write_bytes(b"updated")
+    mock_data_access.push("updated", checksum, change_name_to=fname, strict=True)
+    with open(os.path.join(temp_fs[0], fname), "rb") as f:
+        assert f.read() == b"updated"
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_copy_from_failure_cleanup(mock_data_access, monkeypatch, temp_fs, make_temp):
+    fname = make_temp()
+
+    def fail(*args, **kwargs):
+        raise IOError("connection lost")
+
+    monkeypatch.setattr(da, "copy_stream", fail)
+    with pytest.raises(IOError):
+        mock_data_access.copy_from(fname)
+    assert os.listdir(temp_fs[1]) == []
+
+
+@pytest.mark.skipif(
+    not os.path.isdir("/proc/self/fd"), reason="Needs /proc to count open files"
+)
+def test_download_missing_file(mock_data_access, temp_fs):
+    open_fds = len(os.listdir("/proc/self/fd"))
+    with pytest.raises(IOError):
+        mock_data_access.copy_many_from_parallel(["missing.txt"])
+    assert os.listdir(temp_fs[1]) == []
+    assert len(os.listdir("/proc/self/fd")) == open_fds
+
+
+def test_execute_command(mock_data_access):
+    stdout, stderr = mock_data_access.execute_command("echo foo; echo bar 1>&2")
+    assert stdout == ["foo\n"] and stderr == ["bar\n"]
+    status, stdout, stderr = mock_data_access.shell.run("printf foo; false")
+    assert (status, stdout, stderr) == (1, ["foo"], [])
+
+
+def test_execute_command_isolated(mock_data_access):
+    # neither an unbalanced quote nor a read from stdin stalls the session
+    status, _, stderr = mock_data_access.shell.run("echo 'foo")
+    assert status != 0 and len(stderr) > 0
+    assert mock_data_access.shell.run("cat") == (0, [], [])
+    assert mock_data_access.execute_command("echo foo") == (["foo\n"], [])
+
+
+def test_execute_command_timeout(mock_data_access):
+    class Stream:
+        def readline(self):
+            raise socket.timeout
+
+    shell = mock_data_access.shell
+    shell._stdout = Stream()
+    with pytest.raises(IOError, match="Timed out"):
+        shell.run("sleep 10")
+    assert shell.closed
+    assert mock_data_access.shell is not shell
+    assert mock_data_access.execute_command("echo foo") == (["foo\n"], [])
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Does not run on windows")
+def test_copy_many_from_parallel(mock_data_access, temp_fs, make_temp):
+    fnames = [make_temp() for _ in range(5)]
+    mock_data_access.copy_many_from_parallel(fnames, max_workers=2)
+    for fname in fnames:
+        _check_content(os.path.join(temp_fs[1], fname))
+
+
+def test_local_checksum(monkeypatch, tmp_path):
+    monkeypatch.setattr(da, "_checksum_cache", ChecksumCache(tmp_path / "cache"))
+    data_access = LocalDataAccess(str(tmp_path))
+    (tmp_path / "foo.csv").write_bytes(CONTENT)
+    (tmp_path / "empty.csv").write_bytes(b"")
+
+    expected = f"{hashlib.sha1(CONTENT).hexdigest()}  {tmp_path / 'foo.csv'}"
+    assert expected == data_access.checksum("foo.csv")
+    assert expected == data_access.checksum("foo.csv")
+    assert data_access.checksum("empty.csv").startswith(hashlib.sha1().hexdigest())
+
+
+def test_makedir_once(mock_data_access, monkeypatch, temp_fs):
+    path = str(temp_fs[0] / "foo")
+    mock_data_access.makedir(path)
+    assert os.path.isdir(path)
+
+    def fail(command):
+        raise AssertionError("directory should be known")
+
+    monkeypatch.setattr(mock_data_access, "execute_command", fail)
+    mock_data_access.makedir(path)
+
+
+def test_local_copy(temp_fs):
+    src, dest = temp_fs
+    for i in range(5):
+        (src / f"1_{i}.pkl").write_bytes(CONTENT)
+    (src / "2_0.pkl").write_bytes(CONTENT)
+    LocalDataAccess(str(src)).copy(os.path.join(src, "1_*"), str(dest / "out"))
+    assert sorted(os.listdir(dest / "out")) == [f"1_{i}.pkl" for i in range(5)]
+
+
+def test_reflink_or_copy(monkeypatch, temp_fs):
+    src, dest = temp_fs
+    (src / "foo.mat").write_bytes(CONTENT)
+
+    def fail(src, dest):
+        raise OSError("not supported")
+
+    monkeypatch.setattr(da, "_reflink_supported", None)
+    monkeypatch.setattr(da, "_reflink", fail)
+    assert da.reflink_or_copy(str(src / "foo.mat"), str(dest)) == str(dest / "foo.mat")
+    _check_content(dest / "foo.mat")
+    assert da._reflink_supported is False
+
+
+def test_reflink_or_copy_same_file(temp_fs):
+    src, _ = temp_fs
+    (src / "foo.mat").write_bytes(CONTENT)
+    with pytest.raises(shutil.SameFileError):
+        da.reflink_or_copy(str(src / "foo.mat"), str(src))
+    _check_content(src / "foo.mat")
+
+
+def test_local_copy_prefetch(monkeypatch, temp_fs):
+    src, dest = temp_fs
+    (src / "foo.mat").write_bytes(CONTENT)
+    prefetched = []
+    monkeypatch.setattr(da, "_reflink_supported", False)
+    monkeypatch.setattr(da, "_prefetch", prefetched.append)
+    LocalDataAccess(str(src)).copy(str(src / "*.mat"), str(dest))
+    assert prefetched == [str(src / "foo.mat")]
+    _check_content(dest / "foo.mat")
+
+
+def test_reflink_or_copy_fallback(monkeypatch, temp_fs):
+    src, dest = temp_fs
+    (src / "foo.mat").write_bytes(CONTENT)
+
+    def fail(src, dest):
+        raise OSError("not supported")
+
+    monkeypatch.setattr(da, "_reflink_supported", False)
+    monkeypatch.setattr(da, "_copy_in_kernel", fail)
+    assert da.reflink_or_copy(str(src / "foo.mat"), str(dest)) == str(dest / "foo.mat")
+    _check_content(dest / "foo.mat")
+
+
+def test_copy_in_kernel(monkeypatch, temp_fs):
+    src, dest = temp_fs
+    (src / "foo.mat").write_bytes(CONTENT)
+    monkeypatch.delattr(da.os, "copy_file_range", raising=False)
+    try:
+        da._copy_in_kernel(str(src / "foo.mat"), str(dest / "foo.mat"))
+    except NotImplementedError:
+        pytest.skip("no in-kernel copy on this platform")
+    _check_content(dest / "foo.mat")
+
+
+def test_copy_in_kernel_short(monkeypatch, temp_fs):
+    src, dest = temp_fs
+    (src / "foo.mat").write_bytes(CONTENT)
+    monkeypatch.setattr(da.os, "copy_file_range", lambda *args: 0, raising=False)
+    with pytest.raises(OSError):
+        da._copy_in_kernel(str(src / "foo.mat"), str(dest / "foo.mat"))
+
+    monkeypatch.setattr(da, "_reflink_supported", False)
+    da.reflink_or_copy(str(src / "foo.mat"), str(dest))
+    _check_content(dest / "foo.mat")
+
+
+def test_list_files(tmp_path):
+    for name in ("1_PG.pkl", "1_PF.pkl", "2_PG.pkl", ".1_hidden.pkl"):
+        (tmp_path / name).write_text("")
+    (tmp_path / "1_dir.pkl").mkdir()
+    pattern = str(tmp_path / "1_*.pkl")
+    expected = [str(tmp_path / "1_PF.pkl"), str(tmp_path / "1_PG.pkl")]
+    assert sorted(da._list_files(pattern)) == expected
+    assert da._list_files(str(tmp_path / "2_PG.pkl")) == [str(tmp_path / "2_PG.pkl")]
+    assert da._list_files(str(tmp_path / "missing" / "*.pkl")) == []
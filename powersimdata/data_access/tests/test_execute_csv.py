@@ -7,6 +7,8 @@ import pytest
 from numpy.testing import assert_array_equal
 from pandas.testing import assert_frame_equal
 
+from powersimdata.data_access import data_access as da
+from powersimdata.data_access.checksum_cache import ChecksumCache
 from powersimdata.data_access.data_access import LocalDataAccess, SSHDataAccess
 from powersimdata.data_access.execute_list import ExecuteListManager
 from powersimdata.utility import server_setup, templates
@@ -56,12 +58,15 @@ def clone_template():
 
 
 @pytest.fixture
-def manager():
+def manager(monkeypatch, tmp_path):
+    monkeypatch.setattr(da, "_checksum_cache", ChecksumCache(tmp_path / "cache"))
     test_csv = clone_template()
-    data_access = LocalDataAccess()
+    data_access = LocalDataAccess(server_setup.LOCAL_DIR)
     manager = ExecuteListManager(data_access)
     manager._FILE_NAME = "ExecuteList.csv.test"
+    manager.invalidate()
     yield manager
+    manager.invalidate()
     os.remove(test_csv)
 
 
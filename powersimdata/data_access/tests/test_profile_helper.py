@@ -1,4 +1,8 @@
+import json
+import os
+
 from powersimdata.data_access.profile_helper import ProfileHelper
+from powersimdata.utility import server_setup
 
 
 def test_parse_version_default():
@@ -22,3 +26,19 @@ def test_get_file_components():
     file_name, from_dir = ProfileHelper.get_file_components(s_info, "wind")
     assert "wind_v8.csv" == file_name
     assert ("raw", "europe") == from_dir
+
+
+def test_get_profile_version_local_cached(monkeypatch, tmp_path):
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", str(tmp_path))
+    assert [] == ProfileHelper.get_profile_version_local("usa_tamu", "solar")
+
+    version_file = tmp_path / "version.json"
+    version_file.write_text(json.dumps({"usa_tamu": {"solar": ["v123"]}}))
+    assert ["v123"] == ProfileHelper.get_profile_version_local("usa_tamu", "solar")
+
+    # a cached file is read again once modified
+    version_file.write_text(json.dumps({"usa_tamu": {"solar": ["v123", "v456"]}}))
+    os.utime(version_file, ns=(0, 0))
+    expected = ["v123", "v456"]
+    assert expected == ProfileHelper.get_profile_version_local("usa_tamu", "solar")
+    ProfileHelper.invalidate_profile_versions()
@@ -7,6 +7,8 @@ import pytest
 from numpy.testing import assert_array_equal
 from pandas.testing import assert_frame_equal
 
+from powersimdata.data_access import data_access as da
+from powersimdata.data_access.checksum_cache import ChecksumCache
 from powersimdata.data_access.data_access import LocalDataAccess, SSHDataAccess
 from powersimdata.data_access.scenario_list import ScenarioListManager
 from powersimdata.utility import server_setup, templates
@@ -73,12 +75,15 @@ def clone_template():
 
 
 @pytest.fixture
-def manager():
+def manager(monkeypatch, tmp_path):
+    monkeypatch.setattr(da, "_checksum_cache", ChecksumCache(tmp_path / "cache"))
     test_csv = clone_template()
-    data_access = LocalDataAccess()
+    data_access = LocalDataAccess(server_setup.LOCAL_DIR)
     manager = ScenarioListManager(data_access)
     manager._FILE_NAME = "ScenarioList.csv.test"
+    manager.invalidate()
     yield manager
+    manager.invalidate()
     os.remove(test_csv)
 
 
@@ -126,3 +131,57 @@ def test_delete_entry(manager):
     manager.add_entry(mock_row())
     table = manager.delete_entry(2)
     assert table.shape == (2, 16)
+
+
+def test_table_cached(manager, monkeypatch):
+    downloads = []
+    monkeypatch.setattr(manager.data_access, "copy_from", downloads.append)
+    manager.get_scenario_table()
+    table = manager.get_scenario_table()
+    assert downloads == [manager._FILE_NAME]
+
+    table.loc[1] = ""
+    assert manager.get_scenario_table().shape[0] == 0
+
+    manager.add_entry(mock_row())
+    assert manager.get_scenario_table().shape == (1, 16)
+    assert len(downloads) == 3
+
+
+def test_add_entry_after_concurrent_write(manager):
+    manager.add_entry(mock_row())
+    table = manager.get_scenario_table()
+
+    # another user adds a scenario, leaving the cached table stale
+    table.loc[2] = table.loc[1]
+    table.to_csv(os.path.join(server_setup.LOCAL_DIR, manager._FILE_NAME))
+    assert manager.get_scenario_table().shape[0] == 1
+
+    entry = mock_row()
+    table = manager.add_entry(entry)
+    assert entry["id"] == "3"
+    assert table.shape == (3, 16)
+
+
+def test_get_scenario_by_name(manager):
+    first, second = mock_row(), mock_row()
+    second["name"] = "other"
+    manager.add_entry(first)
+    manager.add_entry(second)
+    assert manager.get_scenario("other")["id"] == "2"
+    assert manager.get_scenario("missing") is None
+    assert manager.get_scenario("\u00b2") is None
+
+    manager.add_entry(mock_row())
+    assert manager.get_scenario("dummy") is None
+    assert manager.get_scenario(3)["name"] == "dummy"
+
+
+def test_commit_utf8(manager):
+    entry = mock_row()
+    entry["name"] = "café"
+    manager.add_entry(entry)
+    path = os.path.join(server_setup.LOCAL_DIR, manager._FILE_NAME)
+    with open(path, "rb") as f:
+        assert "café".encode("utf-8") in f.read()
+    assert manager.get_scenario(1)["name"] == "café"
@@ -1,5 +1,6 @@
 import pandas as pd
 
+from powersimdata.input.helpers import index_isin
 from powersimdata.scenario.scenario import Scenario
 
 default_pmin_dict = {
@@ -76,7 +77,7 @@ def temporal_curtailment(
     all_profiles = pd.concat(
         [getattr(scenario.state, m)() for m in set(profile_methods.values())], axis=1
     )
-    plant_id_mask = ~plant.index.isin(pmin_by_id.keys())
+    plant_id_mask = ~index_isin(plant.index, pmin_by_id.keys())
     base_plant_ids_by_type = plant.loc[plant_id_mask].groupby("type").groups
     valid_profile_types = set(base_plant_ids_by_type) & set(profile_methods)
     plant_ids_for_summed_profiles = set().union(
@@ -1,3 +1,6 @@
+from powersimdata.input.helpers import index_isin
+
+
 def _calculate_common_zone_factors(base_plant, ref_plant, plant_scaling, epsilon=1e-3):
     """Given a base plant dataframe, a reference plant dataframe, and a scaling
     vector: calculate common zone scaling factors, and produce a change-table
@@ -23,7 +26,7 @@ def _calculate_common_zone_factors(base_plant, ref_plant, plant_scaling, epsilon
             change_table[fuel]["zone_id"][zone_id] = 0
             # Since we have zone scaling of 0, we don't need plant scaling
             matching_indices = grouping.get_group((fuel, zone_id)).index
-            matching_boolean = new_plant_scaling.index.isin(matching_indices)
+            matching_boolean = index_isin(new_plant_scaling.index, matching_indices)
             new_plant_scaling = new_plant_scaling[~matching_boolean]
 
     # Determine approximately most common non-zero scaling factor via median
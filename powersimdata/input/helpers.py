@@ -1,6 +1,7 @@
 import os
 from collections import defaultdict
 
+import numpy as np
 import pandas as pd
 
 from powersimdata.input.check import (
@@ -36,6 +37,28 @@ def add_column_to_data_frame(data_frame, column_dict):
         data_frame[key] = value
 
 
+def index_isin(index, values):
+    """Finds index entries that are in a collection of values. Entries of sorted,
+    unique and numeric indices are located by binary search, which only costs a
+    lookup per value rather than per entry.
+
+    :param pandas.Index index: index to search.
+    :param iterable values: values to look for.
+    :return: (*numpy.ndarray*) -- boolean mask, True where the entry is in values.
+    """
+    values = np.asarray(list(values))
+    entries = index.to_numpy()
+    numeric = entries.dtype.kind in "iuf" and values.dtype.kind in "iuf"
+    if not (numeric and index.is_monotonic_increasing and index.is_unique):
+        return index.isin(values)
+    mask = np.zeros(len(entries), dtype=bool)
+    pos = np.searchsorted(entries, values)
+    inside = pos < len(entries)
+    pos, values = pos[inside], values[inside]
+    mask[pos[entries[pos] == values]] = True
+    return mask
+
+
 def add_coord_to_grid_data_frames(grid):
     """Adds longitude and latitude information to bus, plant and branch data
         frames of grid instance.
@@ -61,13 +61,17 @@ class InputData:
     """Load input data.
 
     :param str data_loc: data location.
+    :param powersimdata.data_access.data_access.DataAccess data_access: data access
+        object to use, instead of a new one for the data location.
     """
 
-    def __init__(self, data_loc=None):
+    def __init__(self, data_loc=None, data_access=None):
         """Constructor."""
         os.makedirs(server_setup.LOCAL_DIR, exist_ok=True)
 
-        self.data_access = Context.get_data_access(data_loc)
+        if data_access is None:
+            data_access = Context.get_data_access(data_loc)
+        self.data_access = data_access
 
     def get_data(self, scenario_info, field_name):
         """Returns data either from server or local directory.
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 import pandas as pd
 import pytest
 from numpy.testing import assert_array_almost_equal, assert_array_equal
@@ -17,6 +18,7 @@ from powersimdata.input.helpers import (
     get_plant_id_in_states,
     get_resources_in_grid,
     get_storage_id_in_area,
+    index_isin,
     summarize_plant_to_bus,
     summarize_plant_to_location,
 )
@@ -375,3 +377,15 @@ def test_get_storage_id_in_area():
     for a, e in zip(arg, expected):
         storage_id = get_storage_id_in_area(*a)
         assert e == storage_id
+
+
+def test_index_isin():
+    values = [9, 4, 3, 15, 4]
+    for index in (
+        pd.Index([2, 4, 6, 8, 10]),
+        pd.Index([10, 4, 6, 8, 2]),
+        pd.Index([2, 4, 4, 8, 10]),
+        pd.Index(["a", "b", "c", "d", "e"]),
+    ):
+        assert_array_equal(index_isin(index, values), index.isin(values))
+    assert_array_equal(index_isin(pd.Index([1, 2]), []), np.array([False, False]))
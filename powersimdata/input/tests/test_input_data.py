@@ -1,6 +1,7 @@
 import pytest
 
-from powersimdata.input.input_data import InputHelper, _check_field
+from powersimdata.data_access.data_access import LocalDataAccess
+from powersimdata.input.input_data import InputData, InputHelper, _check_field
 
 
 def test_get_file_components():
@@ -18,3 +19,8 @@ def test_check_field():
     with pytest.raises(ValueError):
         _check_field("foo")
         _check_field("coal")
+
+
+def test_shared_data_access():
+    data_access = LocalDataAccess()
+    assert InputData(data_access=data_access).data_access is data_access
@@ -1,46 +1,56 @@
 import copy
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from powersimdata.input.change_table import ChangeTable
 from powersimdata.input.grid import Grid
 from powersimdata.input.transform_grid import TransformGrid
 
-grid = Grid(["USA"])
+
+@pytest.fixture(scope="session")
+def grid():
+    return Grid(["USA"])
 
 
 @pytest.fixture
-def ct():
+def ct(grid):
     return ChangeTable(grid)
 
 
-def get_plant_id(zone_id, gen_type):
-    plant_id = (
-        grid.plant.groupby(["zone_id", "type"])
-        .get_group((zone_id, gen_type))
-        .index.values.tolist()
-    )
-    return plant_id
+@pytest.fixture(scope="session")
+def get_plant_id(grid):
+    groups = grid.plant.groupby(["zone_id", "type"]).indices
 
+    def _get_plant_id(zone_id, gen_type):
+        return grid.plant.index[groups[(zone_id, gen_type)]].tolist()
 
-def get_branch_id(zone_id):
-    branch_id = (
-        grid.branch.groupby(["from_zone_id", "to_zone_id"])
-        .get_group((zone_id, zone_id))
-        .index.values.tolist()
-    )
-    return branch_id
+    return _get_plant_id
+
+
+@pytest.fixture(scope="session")
+def get_branch_id(grid):
+    groups = grid.branch.groupby(["from_zone_id", "to_zone_id"]).indices
 
+    def _get_branch_id(zone_id):
+        return grid.branch.index[groups[(zone_id, zone_id)]].tolist()
 
-def test_that_only_capacities_are_modified_when_scaling_renewable_gen(ct):
+    return _get_branch_id
+
+
+def test_that_only_capacities_are_modified_when_scaling_renewable_gen(
+    grid, ct, get_plant_id
+):
     gen_type = "solar"
     zone = "Utah"
     factor = 1.41
     ct.scale_plant_capacity(gen_type, zone_name={zone: factor})
     new_grid = TransformGrid(grid, ct.ct).get_grid()
 
-    ref_grid = copy.deepcopy(grid)
+    # only the plant table is modified, other tables can be shared
+    ref_grid = copy.copy(grid)
+    ref_grid.plant = grid.plant.copy()
     plant_id = get_plant_id(grid.zone2id[zone], gen_type)
 
     assert new_grid != ref_grid
@@ -48,7 +58,7 @@ def test_that_only_capacities_are_modified_when_scaling_renewable_gen(ct):
     assert new_grid == ref_grid
 
 
-def test_scale_gen_capacity_one_zone(ct):
+def test_scale_gen_capacity_one_zone(grid, ct, get_plant_id):
     gen_type = "coal"
     zone = "Colorado"
     factor = 2.0
@@ -64,7 +74,7 @@ def test_scale_gen_capacity_one_zone(ct):
     assert new_pmax.loc[plant_id].equals(factor * pmax.loc[plant_id])
 
 
-def test_scale_thermal_gen_gencost_two_types_two_zones(ct):
+def test_scale_thermal_gen_gencost_two_types_two_zones(grid, ct, get_plant_id):
     gen_type = ["ng", "coal"]
     zone = ["Louisiana", "Montana Eastern"]
     factor = [0.8, 1.25]
@@ -89,7 +99,7 @@ def test_scale_thermal_gen_gencost_two_types_two_zones(ct):
         assert new_c2.loc[i].equals(c2.loc[i] / f)
 
 
-def test_scale_renewable_gen_gencost_one_zone(ct):
+def test_scale_renewable_gen_gencost_one_zone(grid, ct):
     ct.scale_plant_capacity("wind", zone_name={"Washington": 2.3})
     new_grid = TransformGrid(grid, ct.ct).get_grid()
 
@@ -99,7 +109,7 @@ def test_scale_renewable_gen_gencost_one_zone(ct):
     assert new_grid.gencost["before"].c2.equals(grid.gencost["before"].c2)
 
 
-def test_scale_gen_one_plant(ct):
+def test_scale_gen_one_plant(grid, ct):
     plant_id = 3000
     gen_type = grid.plant.loc[plant_id].type
     factor = 0.33
@@ -133,7 +143,7 @@ def test_scale_gen_one_plant(ct):
         assert new_c2.loc[plant_id] == c2.loc[plant_id] / factor
 
 
-def test_scale_gencost_one_plant(ct):
+def test_scale_gencost_one_plant(grid, ct):
     # This must be the plant ID of a non-zero-cost resource
     plant_id = 3000
     gen_type = grid.plant.loc[plant_id].type
@@ -158,7 +168,7 @@ def test_scale_gencost_one_plant(ct):
     )
 
 
-def test_scale_gencost_two_types_two_zones(ct):
+def test_scale_gencost_two_types_two_zones(grid, ct, get_plant_id):
     gen_type = ["ng", "coal"]
     zone = ["Louisiana", "Montana Eastern"]
     factor = [0.8, 1.25]
@@ -199,7 +209,7 @@ def test_scale_gencost_two_types_two_zones(ct):
             )
 
 
-def test_scale_gen_pmin_one_plant(ct):
+def test_scale_gen_pmin_one_plant(grid, ct):
     # This must be the plant ID of a non-zero-cost resource
     plant_id = 3000
     gen_type = grid.plant.loc[plant_id].type
@@ -224,7 +234,7 @@ def test_scale_gen_pmin_one_plant(ct):
     )
 
 
-def test_scale_gen_pmin_two_types_two_zones(ct):
+def test_scale_gen_pmin_two_types_two_zones(grid, ct, get_plant_id):
     gen_type = ["ng", "coal"]
     zone = ["Louisiana", "Montana Eastern"]
     factor = [0.8, 1.25]
@@ -257,7 +267,7 @@ def test_scale_gen_pmin_two_types_two_zones(ct):
         )
 
 
-def test_scale_branch_one_zone(ct):
+def test_scale_branch_one_zone(grid, ct, get_branch_id):
     factor = 4
     zone = "Washington"
     ct.scale_branch_capacity(zone_name={"Washington": factor})
@@ -277,7 +287,7 @@ def test_scale_branch_one_zone(ct):
     assert new_x.loc[branch_id].equals(x.loc[branch_id] / factor)
 
 
-def test_scale_branch_two_zones(ct):
+def test_scale_branch_two_zones(grid, ct, get_branch_id):
     factor = [0.3, 1.25]
     zone = ["West Virginia", "Nevada"]
     ct.scale_branch_capacity(zone_name={z: f for z, f in zip(zone, factor)})
@@ -298,7 +308,7 @@ def test_scale_branch_two_zones(ct):
         assert new_x.loc[i].equals(x.loc[i] / f)
 
 
-def test_scale_one_branch(ct):
+def test_scale_one_branch(grid, ct):
     branch_id = 11111
     factor = 1.62
     ct.scale_branch_capacity(branch_id={branch_id: factor})
@@ -317,7 +327,7 @@ def test_scale_one_branch(ct):
     assert new_x.loc[branch_id] == x.loc[branch_id] / factor
 
 
-def test_scale_dcline(ct):
+def test_scale_dcline(grid, ct):
     dcline_id = [2, 4, 6]
     factor = [1.2, 1.6, 0]
     ct.scale_dcline_capacity({i: f for i, f in zip(dcline_id, factor)})
@@ -341,7 +351,7 @@ def test_scale_dcline(ct):
         assert new_status.loc[i] == 0 if f == 0 else 1
 
 
-def test_add_branch(ct):
+def test_add_branch(grid, ct):
     new_branch = [
         {"capacity": 150, "from_bus_id": 8, "to_bus_id": 100},
         {"capacity": 250, "from_bus_id": 8000, "to_bus_id": 30000},
@@ -365,7 +375,7 @@ def test_add_branch(ct):
     )
 
 
-def test_added_branch_scaled(ct):
+def test_added_branch_scaled(grid, ct):
     new_branch = [
         {"capacity": 150, "from_bus_id": 8, "to_bus_id": 100},
         {"capacity": 250, "from_bus_id": 8000, "to_bus_id": 30000},
@@ -388,7 +398,7 @@ def test_added_branch_scaled(ct):
             assert new_capacity.loc[new_id] == new_branch[i]["capacity"]
 
 
-def test_add_dcline(ct):
+def test_add_dcline(grid, ct):
     new_dcline = [
         {"capacity": 2000, "from_bus_id": 200, "to_bus_id": 2000},
         {"capacity": 1000, "from_bus_id": 3001001, "to_bus_id": 1},
@@ -416,7 +426,7 @@ def test_add_dcline(ct):
     )
 
 
-def test_add_gen_add_entries_in_plant_data_frame(ct):
+def test_add_gen_add_entries_in_plant_data_frame(grid, ct):
     new_plant = [
         {"type": "solar", "bus_id": 2050363, "Pmax": 85},
         {"type": "wind", "bus_id": 9, "Pmin": 5, "Pmax": 60},
@@ -439,23 +449,19 @@ def test_add_gen_add_entries_in_plant_data_frame(ct):
     new_status = new_grid.plant.status.values
     new_index = new_grid.plant.index
     old_index = grid.plant.index
+    expected = pd.DataFrame(new_plant).reindex(columns=["Pmin", "Pmax"]).fillna(0)
 
     assert new_grid.plant.shape[0] != grid.plant.shape[0]
     assert np.array_equal(
         new_index[-len(new_plant) :],
         range(old_index[-1] + 1, old_index[-1] + 1 + len(new_plant)),
     )
-    assert np.array_equal(
-        new_pmin[-len(new_plant) :],
-        np.array([p["Pmin"] if "Pmin" in p.keys() else 0 for p in new_plant]),
-    )
-    assert np.array_equal(
-        new_pmax[-len(new_plant) :], np.array([p["Pmax"] for p in new_plant])
-    )
+    assert np.array_equal(new_pmin[-len(new_plant) :], expected["Pmin"].to_numpy())
+    assert np.array_equal(new_pmax[-len(new_plant) :], expected["Pmax"].to_numpy())
     assert np.array_equal(new_status[-len(new_plant) :], np.array([1] * len(new_plant)))
 
 
-def test_add_gen_add_entries_in_gencost_data_frame(ct):
+def test_add_gen_add_entries_in_gencost_data_frame(grid, ct):
     new_plant = [
         {"type": "solar", "bus_id": 2050363, "Pmax": 15},
         {"type": "wind", "bus_id": 555, "Pmin": 5, "Pmax": 60},
@@ -483,6 +489,7 @@ def test_add_gen_add_entries_in_gencost_data_frame(ct):
     new_n = new_grid.gencost["before"].n.values
     new_index = new_grid.gencost["before"].index
     old_index = grid.gencost["before"].index
+    expected = pd.DataFrame(new_plant).reindex(columns=["c0", "c1", "c2"]).fillna(0)
 
     assert new_grid.gencost["before"] is new_grid.gencost["after"]
     assert new_grid.gencost["before"].shape[0] != grid.gencost["before"].shape[0]
@@ -490,18 +497,9 @@ def test_add_gen_add_entries_in_gencost_data_frame(ct):
         new_index[-len(new_plant) :],
         range(old_index[-1] + 1, old_index[-1] + 1 + len(new_plant)),
     )
-    assert np.array_equal(
-        new_c0[-len(new_plant) :],
-        np.array([p["c0"] if "c0" in p.keys() else 0 for p in new_plant]),
-    )
-    assert np.array_equal(
-        new_c1[-len(new_plant) :],
-        np.array([p["c1"] if "c1" in p.keys() else 0 for p in new_plant]),
-    )
-    assert np.array_equal(
-        new_c2[-len(new_plant) :],
-        np.array([p["c2"] if "c2" in p.keys() else 0 for p in new_plant]),
-    )
+    assert np.array_equal(new_c0[-len(new_plant) :], expected["c0"].to_numpy())
+    assert np.array_equal(new_c1[-len(new_plant) :], expected["c1"].to_numpy())
+    assert np.array_equal(new_c2[-len(new_plant) :], expected["c2"].to_numpy())
     assert np.array_equal(new_type[-len(new_plant) :], np.array([2] * len(new_plant)))
     assert np.array_equal(
         new_startup[-len(new_plant) :], np.array([0] * len(new_plant))
@@ -512,7 +510,7 @@ def test_add_gen_add_entries_in_gencost_data_frame(ct):
     assert np.array_equal(new_n[-len(new_plant) :], np.array([3] * len(new_plant)))
 
 
-def test_add_storage(ct):
+def test_add_storage(grid, ct):
     storage = [
         {"bus_id": 2021005, "capacity": 116.0},
         {"bus_id": 2028827, "capacity": 82.5},
@@ -529,7 +527,7 @@ def test_add_storage(ct):
     assert np.array_equal(pmax, np.array([d["capacity"] for d in storage]))
 
 
-def test_add_bus(ct):
+def test_add_bus(grid, ct):
     prev_num_buses = len(grid.bus.index)
     prev_max_bus = grid.bus.index.max()
     prev_num_subs = len(grid.sub.index)
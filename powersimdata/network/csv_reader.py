@@ -1,16 +1,81 @@
+import functools
+import os
+
+import numpy as np
+import pandas as pd
+
 from powersimdata.input.helpers import csv_to_data_frame
 
+_CHUNK_SIZE = 1 << 14
+_INTERCONNECT_DTYPE = pd.CategoricalDtype(["Eastern", "Texas", "Western"])
+_INTERCONNECT_COLUMNS = {"dcline.csv": ("from_interconnect", "to_interconnect")}
+
 
 class CSVReader:
     """MPC files reader.
 
     :param str data_loc: path to data.
+    :param list interconnect: interconnect(s) to keep. If None, all rows are read.
     """
 
-    def __init__(self, data_loc):
+    def __init__(self, data_loc, interconnect=None):
         """Constructor"""
-        self.bus = csv_to_data_frame(data_loc, "bus.csv")
-        self.plant = csv_to_data_frame(data_loc, "plant.csv")
-        self.gencost = csv_to_data_frame(data_loc, "gencost.csv")
-        self.branch = csv_to_data_frame(data_loc, "branch.csv")
-        self.dcline = csv_to_data_frame(data_loc, "dcline.csv")
+        for name in ("bus", "plant", "gencost", "branch", "dcline"):
+            data = read_interconnect_csv(data_loc, f"{name}.csv", interconnect)
+            setattr(self, name, data)
+
+
+def read_interconnect_csv(data_loc, filename, interconnect=None):
+    """Reads CSV, only keeping rows located in the given interconnect(s). The file
+    is parsed by chunks so that rows of other interconnects are never all held in
+    memory. Rows of *dcline.csv* must have both ends in the interconnect(s).
+
+    :param str data_loc: path to data.
+    :param str filename: name of the file.
+    :param list interconnect: interconnect(s) to keep. If None, all rows are read.
+    :return: (*pandas.DataFrame*) -- created data frame.
+    """
+    if interconnect is None:
+        return csv_to_data_frame(data_loc, filename)
+    print("Reading %s" % filename)
+    columns = _INTERCONNECT_COLUMNS.get(filename, ("interconnect",))
+    chunks = pd.read_csv(
+        os.path.join(data_loc, filename),
+        index_col=0,
+        float_precision="high",
+        chunksize=_CHUNK_SIZE,
+        dtype=dict.fromkeys(columns, _INTERCONNECT_DTYPE),
+    )
+    allowed = _get_allowed_codes(tuple(interconnect))
+    data_frame = pd.concat(
+        chunk.loc[_in_interconnect(chunk, columns, allowed)] for chunk in chunks
+    )
+    # the categorical dtype only serves the filter, hand back plain strings
+    return data_frame.astype(dict.fromkeys(columns, object))
+
+
+@functools.lru_cache(maxsize=8)
+def _get_allowed_codes(interconnect):
+    """Builds a lookup table telling whether an interconnect category code belongs
+    to the given interconnect(s). It is shared by all the files read.
+
+    :param tuple interconnect: interconnect name(s).
+    :return: (*numpy.ndarray*) -- boolean table indexed by category code. The
+        trailing False catches missing values, whose code is -1.
+    """
+    return np.append(_INTERCONNECT_DTYPE.categories.isin(interconnect), False)
+
+
+def _in_interconnect(data_frame, columns, allowed):
+    """Finds rows located in the given interconnect(s).
+
+    :param pandas.DataFrame data_frame: data frame to filter.
+    :param tuple columns: categorical columns holding the interconnect of each
+        row, all of which must match.
+    :param numpy.ndarray allowed: boolean lookup table indexed by category code.
+    :return: (*numpy.ndarray*) -- boolean mask of the rows to keep.
+    """
+    mask = allowed[data_frame[columns[0]].cat.codes.to_numpy()]
+    for c in columns[1:]:
+        mask &= allowed[data_frame[c].cat.codes.to_numpy()]
+    return mask
@@ -1,14 +1,19 @@
 import os
 
+import pandas as pd
+
 from powersimdata.input.abstract_grid import AbstractGrid
 from powersimdata.input.helpers import (
     add_coord_to_grid_data_frames,
     add_zone_to_grid_data_frames,
     csv_to_data_frame,
 )
-from powersimdata.network.csv_reader import CSVReader
+from powersimdata.network.csv_reader import CSVReader, read_interconnect_csv
 from powersimdata.network.usa_tamu.constants.storage import defaults
 
+_data_loc = os.path.join(os.path.dirname(__file__), "data")
+_data_loc_exists = os.path.isdir(_data_loc)
+
 
 class TAMU(AbstractGrid):
     """TAMU network.
@@ -29,16 +34,14 @@ class TAMU(AbstractGrid):
 
         :raises IOError: if directory does not exist.
         """
-        top_dirname = os.path.dirname(__file__)
-        data_loc = os.path.join(top_dirname, "data")
-        if os.path.isdir(data_loc) is False:
-            raise IOError("%s directory not found" % data_loc)
+        if _data_loc_exists is False:
+            raise IOError("%s directory not found" % _data_loc)
         else:
-            self.data_loc = data_loc
+            self.data_loc = _data_loc
 
     def _build_network(self):
         """Build network."""
-        reader = CSVReader(self.data_loc)
+        reader = CSVReader(self.data_loc, _rows_filter(self.interconnect))
         self.bus = reader.bus
         self.plant = reader.plant
         self.branch = reader.branch
@@ -49,29 +52,14 @@ class TAMU(AbstractGrid):
 
         add_information_to_model(self)
 
-        if "USA" not in self.interconnect:
-            self._drop_interconnect()
 
-    def _drop_interconnect(self):
-        """Trim data frames to only keep information pertaining to the user
-        defined interconnect(s).
+def _rows_filter(interconnect):
+    """Get the interconnect(s) rows must belong to when reading data.
 
-        """
-        for key, value in self.__dict__.items():
-            if key in ["sub", "bus2sub", "bus", "plant", "branch"]:
-                value.query("interconnect == @self.interconnect", inplace=True)
-            elif key == "gencost":
-                value["before"].query(
-                    "interconnect == @self.interconnect", inplace=True
-                )
-            elif key == "dcline":
-                value.query(
-                    "from_interconnect == @self.interconnect &"
-                    "to_interconnect == @self.interconnect",
-                    inplace=True,
-                )
-        self.id2zone = {k: self.id2zone[k] for k in self.bus.zone_id.unique()}
-        self.zone2id = {value: key for key, value in self.id2zone.items()}
+    :param list interconnect: interconnect name(s).
+    :return: (*list*) -- interconnect name(s), or None if all rows are kept.
+    """
+    return None if "USA" in interconnect else interconnect
 
 
 def check_and_format_interconnect(interconnect):
@@ -115,9 +103,13 @@ def add_information_to_model(model):
 
     :param powersimdata.input.TAMU model: TAMU instance.
     """
-    model.sub = csv_to_data_frame(model.data_loc, "sub.csv")
-    model.bus2sub = csv_to_data_frame(model.data_loc, "bus2sub.csv")
-    model.id2zone = csv_to_data_frame(model.data_loc, "zone.csv").zone_name.to_dict()
+    interconnect = _rows_filter(model.interconnect)
+    model.sub = read_interconnect_csv(model.data_loc, "sub.csv", interconnect)
+    model.bus2sub = read_interconnect_csv(model.data_loc, "bus2sub.csv", interconnect)
+    zone_name = csv_to_data_frame(model.data_loc, "zone.csv").zone_name
+    if interconnect is not None:
+        zone_name = zone_name.loc[pd.unique(model.bus["zone_id"].to_numpy())]
+    model.id2zone = zone_name.to_dict()
     model.zone2id = {v: k for k, v in model.id2zone.items()}
 
     add_zone_to_grid_data_frames(model)
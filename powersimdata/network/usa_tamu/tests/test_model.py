@@ -69,3 +69,10 @@ def test_drop_two_interconnect():
     _assert_lists_equal(["Western"], model.interconnect)
     for interconnect in ["Eastern", "Texas"]:
         _assert_interconnect_missing(interconnect, model)
+
+
+def test_interconnect_dtype():
+    model = TAMU(["Western"])
+    for df in (model.bus, model.plant, model.branch, model.gencost["before"]):
+        assert df.interconnect.dtype == object
+    assert model.dcline.from_interconnect.dtype == object
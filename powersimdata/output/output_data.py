@@ -14,12 +14,16 @@ class OutputData:
     """Load output data.
 
     :param str data_loc: data location.
+    :param powersimdata.data_access.data_access.DataAccess data_access: data access
+        object to use, instead of a new one for the data location.
     """
 
-    def __init__(self, data_loc=None):
+    def __init__(self, data_loc=None, data_access=None):
         """Constructor"""
         os.makedirs(server_setup.LOCAL_DIR, exist_ok=True)
-        self._data_access = Context.get_data_access(data_loc)
+        if data_access is None:
+            data_access = Context.get_data_access(data_loc)
+        self._data_access = data_access
 
     def get_data(self, scenario_id, field_name):
         """Returns data either from server or from local directory.
@@ -50,6 +54,27 @@ class OutputData:
         self._data_access.copy_from(file_name, remote_dir)
         return pd.read_pickle(filepath)
 
+    def download_data(self, scenario_id, field_names):
+        """Downloads the given fields not found in local directory, transferring
+        files concurrently.
+
+        :param str scenario_id: scenario id.
+        :param list field_names: fields to download, see :meth:`get_data`.
+        :raises ValueError: if a field is not allowable.
+        """
+        for field_name in field_names:
+            _check_field(field_name)
+
+        from_dir = server_setup.OUTPUT_DIR
+        local_dir = os.path.join(server_setup.LOCAL_DIR, *from_dir)
+        file_names = [f"{scenario_id}_{f}.pkl" for f in field_names]
+        missing = [
+            f for f in file_names if not os.path.isfile(os.path.join(local_dir, f))
+        ]
+        if len(missing) > 0:
+            remote_dir = self._data_access.join(*from_dir)
+            self._data_access.copy_many_from_parallel(missing, remote_dir)
+
 
 def _check_field(field_name):
     """Checks field name.
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from powersimdata.data_access.data_access import LocalDataAccess
+from powersimdata.output.output_data import OutputData, _check_field
+from powersimdata.utility import server_setup
+
+
+@pytest.fixture
+def output_data(monkeypatch, tmp_path):
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", str(tmp_path))
+    data_access = LocalDataAccess(str(tmp_path))
+    downloads = []
+
+    def copy_many_from_parallel(file_names, from_dir=None):
+        downloads.append((file_names, from_dir))
+
+    monkeypatch.setattr(data_access, "copy_many_from_parallel", copy_many_from_parallel)
+    output_data = OutputData(data_access=data_access)
+    output_data.downloads = downloads
+    return output_data
+
+
+def test_check_field():
+    _check_field("PG")
+    _check_field("LOAD_SHED")
+    with pytest.raises(ValueError):
+        _check_field("foo")
+
+
+def test_download_data_skips_local(output_data):
+    local_dir = os.path.join(server_setup.LOCAL_DIR, *server_setup.OUTPUT_DIR)
+    os.makedirs(local_dir)
+    open(os.path.join(local_dir, "1_PG.pkl"), "wb").close()
+    os.makedirs(os.path.join(local_dir, "1_PF.pkl"))
+
+    output_data.download_data("1", ["PG", "PF", "LMP"])
+    remote_dir = output_data._data_access.join(*server_setup.OUTPUT_DIR)
+    assert output_data.downloads == [(["1_PF.pkl", "1_LMP.pkl"], remote_dir)]
+
+
+def test_download_data_all_local(output_data):
+    local_dir = os.path.join(server_setup.LOCAL_DIR, *server_setup.OUTPUT_DIR)
+    os.makedirs(local_dir)
+    open(os.path.join(local_dir, "1_PG.pkl"), "wb").close()
+
+    output_data.download_data("1", ["PG"])
+    assert output_data.downloads == []
+
+
+def test_download_data_bad_field(output_data):
+    with pytest.raises(ValueError):
+        output_data.download_data("1", ["PG", "foo"])
+    assert output_data.downloads == []
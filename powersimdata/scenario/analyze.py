@@ -3,6 +3,7 @@ import pickle
 
 import pandas as pd
 
+from powersimdata.data_access.context import Context
 from powersimdata.input.grid import Grid
 from powersimdata.input.input_data import InputData
 from powersimdata.input.transform_profile import TransformProfile
@@ -30,6 +31,7 @@ class Analyze(Ready):
         "get_pg",
         "get_storage_e",
         "get_storage_pg",
+        "download_output_data",
         "print_infeasibilities",
     } | Ready.exported_methods
 
@@ -38,6 +40,11 @@ class Analyze(Ready):
         super().__init__(scenario)
 
         self.data_loc = "disk" if scenario.status == "moved" else None
+        # data moved to the backup disk is read from a data access rooted there
+        if self.data_loc is None:
+            self._data_loc_access = self._data_access
+        else:
+            self._data_loc_access = Context.get_data_access(self.data_loc)
         self.refresh(scenario)
 
     def refresh(self, scenario):
@@ -59,7 +66,7 @@ class Analyze(Ready):
 
     def _set_ct_and_grid(self):
         """Sets change table and grid."""
-        input_data = InputData(data_loc=self.data_loc)
+        input_data = InputData(data_access=self._data_loc_access)
         grid_mat_path = input_data.get_data(self._scenario_info, "grid")
         self.grid = Grid(
             interconnect=[None],
@@ -117,7 +124,7 @@ class Analyze(Ready):
 
         :return: (*pandas.DataFrame*) -- data frame of power generated.
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         pg = output_data.get_data(self._scenario_info["id"], "PG")
 
         return pg
@@ -127,7 +134,7 @@ class Analyze(Ready):
 
         :return: (*pandas.DataFrame*) -- data frame of power flow.
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         pf = output_data.get_data(self._scenario_info["id"], "PF")
 
         return pf
@@ -137,7 +144,7 @@ class Analyze(Ready):
 
         :return: (*pandas.DataFrame*) -- data frame of power flow on DC line(s).
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         dcline_pf = output_data.get_data(self._scenario_info["id"], "PF_DCLINE")
 
         return dcline_pf
@@ -147,7 +154,7 @@ class Analyze(Ready):
 
         :return: (*pandas.DataFrame*) -- data frame of nodal prices.
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         lmp = output_data.get_data(self._scenario_info["id"], "LMP")
 
         return lmp
@@ -157,7 +164,7 @@ class Analyze(Ready):
 
         :return: (*pandas.DataFrame*) -- data frame of branch flow mu (upper).
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         congu = output_data.get_data(self._scenario_info["id"], "CONGU")
 
         return congu
@@ -167,7 +174,7 @@ class Analyze(Ready):
 
         :return: (*pandas.DataFrame*) -- data frame of branch flow mu (lower).
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         congl = output_data.get_data(self._scenario_info["id"], "CONGL")
 
         return congl
@@ -178,7 +185,7 @@ class Analyze(Ready):
         :return: (*pandas.DataFrame*) -- data frame of averaged congestion with
             the branch id as indices an the averaged CONGL and CONGU as columns.
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         mean_cong = output_data.get_data(self._scenario_info["id"], "AVERAGED_CONG")
 
         return mean_cong
@@ -189,7 +196,7 @@ class Analyze(Ready):
         :return: (*pandas.DataFrame*) -- data frame of power generated by
             storage units.
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         storage_pg = output_data.get_data(self._scenario_info["id"], "STORAGE_PG")
 
         return storage_pg
@@ -199,11 +206,24 @@ class Analyze(Ready):
 
         :return: (*pandas.DataFrame*) -- data frame of energy state of charge.
         """
-        output_data = OutputData(data_loc=self.data_loc)
+        output_data = OutputData(data_access=self._data_loc_access)
         storage_e = output_data.get_data(self._scenario_info["id"], "STORAGE_E")
 
         return storage_e
 
+    def download_output_data(self):
+        """Downloads all output data of the scenario not found on local machine,
+        transferring files concurrently.
+        """
+        fields = ["PG", "PF", "LMP", "CONGU", "CONGL", "AVERAGED_CONG"]
+        grid = self.get_grid()
+        if len(grid.dcline) > 0:
+            fields.append("PF_DCLINE")
+        if len(grid.storage["gen"]) > 0:
+            fields += ["STORAGE_PG", "STORAGE_E"]
+        output_data = OutputData(data_access=self._data_loc_access)
+        output_data.download_data(self._scenario_info["id"], fields)
+
     def get_load_shed(self):
         """Returns LOAD_SHED data frame, either via loading or calculating.
 
@@ -212,7 +232,7 @@ class Analyze(Ready):
         scenario_id = self._scenario_info["id"]
         try:
             # It's either on the server or in our local ScenarioData folder
-            output_data = OutputData(data_loc=self.data_loc)
+            output_data = OutputData(data_access=self._data_loc_access)
             load_shed = output_data.get_data(scenario_id, "LOAD_SHED")
         except OSError:
             # The scenario was run without load_shed, and we must construct it
@@ -62,7 +62,7 @@ class Execute(Ready):
             source=self._scenario_info["grid_model"],
         )
         if self._scenario_info["change_table"] == "Yes":
-            input_data = InputData()
+            input_data = InputData(data_access=self._data_access)
             self.ct = input_data.get_data(self._scenario_info, "ct")
             self.grid = TransformGrid(base_grid, self.ct).get_grid()
         else:
@@ -71,10 +71,12 @@ class Execute(Ready):
 
     def _update_scenario_status(self):
         """Updates scenario status."""
+        self._execute_list_manager.invalidate()
         self._scenario_status = self._execute_list_manager.get_status(self.scenario_id)
 
     def _update_scenario_info(self):
         """Updates scenario information."""
+        self._scenario_list_manager.invalidate()
         self._scenario_info = self._scenario_list_manager.get_scenario(self.scenario_id)
 
     def print_scenario_status(self):
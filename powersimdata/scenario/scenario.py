@@ -1,15 +1,8 @@
 from collections import OrderedDict
 
-import pandas as pd
-
 from powersimdata.data_access.context import Context
 from powersimdata.data_access.execute_list import ExecuteListManager
 from powersimdata.data_access.scenario_list import ScenarioListManager
-from powersimdata.scenario.analyze import Analyze
-from powersimdata.scenario.create import Create, _Builder
-from powersimdata.scenario.execute import Execute
-
-pd.set_option("display.max_colwidth", None)
 
 
 class Scenario:
@@ -17,6 +10,9 @@ class Scenario:
 
     :param int/str descriptor: scenario name or index. If None, default to a Scenario
         in Create state.
+    :param powersimdata.data_access.data_access.DataAccess data_access: data access
+        object to use, so that several scenarios can share a connection. If None,
+        a new one is created.
     """
 
     _setattr_allowlist = {
@@ -44,18 +40,23 @@ class Scenario:
         ("engine", ""),
     ]
 
-    def __init__(self, descriptor=None):
+    def __init__(self, descriptor=None, data_access=None):
         """Constructor."""
         if isinstance(descriptor, int):
             descriptor = str(descriptor)
         if descriptor is not None and not isinstance(descriptor, str):
             raise TypeError("Descriptor must be a string or int (for a Scenario ID)")
 
-        self.data_access = Context.get_data_access()
+        if data_access is None:
+            data_access = Context.get_data_access()
+        self.data_access = data_access
         self._scenario_list_manager = ScenarioListManager(self.data_access)
         self._execute_list_manager = ExecuteListManager(self.data_access)
 
+        # states are imported on demand as they pull in the heavier dependencies
         if not descriptor:
+            from powersimdata.scenario.create import Create
+
             self.info = OrderedDict(self._default_info)
             self.status = None
             self.state = Create(self)
@@ -65,8 +66,12 @@ class Scenario:
                 state = self.info["state"]
                 self._set_status()
                 if state == "execute":
+                    from powersimdata.scenario.execute import Execute
+
                     self.state = Execute(self)
                 elif state == "analyze":
+                    from powersimdata.scenario.analyze import Analyze
+
                     self.state = Analyze(self)
             except AttributeError:
                 pass
@@ -85,7 +90,11 @@ class Scenario:
     def __setattr__(self, name, value):
         if name in self._setattr_allowlist:
             super().__setattr__(name, value)
-        elif isinstance(self.state, Create) and name in _Builder.exported_methods:
+            return
+
+        from powersimdata.scenario.create import Create, _Builder
+
+        if isinstance(self.state, Create) and name in _Builder.exported_methods:
             raise AttributeError(
                 f"{name} is exported from Scenario.state.builder, "
                 "edit it there if necessary"
@@ -105,6 +114,10 @@ class Scenario:
         :param str descriptor: scenario descriptor.
         """
         info = self._scenario_list_manager.get_scenario(descriptor)
+        if info is None:
+            # the cached table may predate the scenario, fetch it again
+            self._scenario_list_manager.invalidate()
+            info = self._scenario_list_manager.get_scenario(descriptor)
         if info is None:
             raise ValueError(
                 f"{descriptor} not found in Scenario List. "
@@ -115,7 +128,12 @@ class Scenario:
     def _set_status(self):
         """Sets execution status of scenario."""
         scenario_id = self.info["id"]
-        self.status = self._execute_list_manager.get_status(scenario_id)
+        try:
+            self.status = self._execute_list_manager.get_status(scenario_id)
+        except Exception:
+            # the cached table may predate the scenario, fetch it again
+            self._execute_list_manager.invalidate()
+            self.status = self._execute_list_manager.get_status(scenario_id)
 
     def get_scenario_table(self):
         """Get scenario table
@@ -1,6 +1,21 @@
+import os
+import shutil
+import subprocess
+import sys
+from collections import OrderedDict
+
 import pytest
 
+from powersimdata.data_access import data_access as da
+from powersimdata.data_access.checksum_cache import ChecksumCache
+from powersimdata.data_access.data_access import LocalDataAccess
+from powersimdata.data_access.execute_list import ExecuteListManager
+from powersimdata.data_access.scenario_list import ScenarioListManager
+from powersimdata.output.output_data import OutputData
+from powersimdata.scenario.analyze import Analyze
 from powersimdata.scenario.scenario import Scenario
+from powersimdata.tests.mock_grid import MockGrid
+from powersimdata.utility import server_setup, templates
 
 
 @pytest.mark.integration
@@ -9,3 +24,61 @@ def test_bad_scenario_name():
     # This test will fail if we do add a scenario with this name
     with pytest.raises(ValueError):
         Scenario("this_scenario_does_not_exist")
+
+
+def test_shared_data_access():
+    data_access = LocalDataAccess()
+    scenarios = [Scenario(data_access=data_access) for _ in range(2)]
+    for s in scenarios:
+        assert s.data_access is data_access
+        assert s.state._data_access is data_access
+        assert s._scenario_list_manager.data_access is data_access
+        assert s._execute_list_manager.data_access is data_access
+
+
+def test_setattr_allowlist_is_lazy():
+    code = (
+        "import sys\n"
+        "from powersimdata.scenario.scenario import Scenario\n"
+        "s = Scenario.__new__(Scenario)\n"
+        "s.info = {}\n"
+        "assert 'powersimdata.scenario.create' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_scenarios_share_list_fetch(monkeypatch, tmp_path):
+    monkeypatch.setattr(server_setup, "LOCAL_DIR", str(tmp_path))
+    monkeypatch.setattr(da, "_checksum_cache", ChecksumCache(tmp_path / "cache"))
+    for name in ("ScenarioList.csv", "ExecuteList.csv"):
+        shutil.copy(os.path.join(templates.__path__[0], name), tmp_path)
+    data_access = LocalDataAccess(str(tmp_path))
+    for _ in range(2):
+        info = OrderedDict(Scenario._default_info)
+        ScenarioListManager(data_access).add_entry(info)
+        ExecuteListManager(data_access).add_entry(info)
+
+    downloads = []
+    monkeypatch.setattr(data_access, "copy_from", downloads.append)
+    for scenario_id in ("1", "2"):
+        scenario = Scenario(scenario_id, data_access=data_access)
+        assert scenario.status == "created"
+    assert sorted(downloads) == ["ExecuteList.csv", "ScenarioList.csv"]
+
+
+def test_download_output_data(monkeypatch):
+    requests = []
+
+    def download_data(self, scenario_id, field_names):
+        requests.append((scenario_id, field_names))
+
+    monkeypatch.setattr(OutputData, "download_data", download_data)
+    state = Analyze.__new__(Analyze)
+    state._scenario_info = {"id": "1"}
+    state._data_loc_access = LocalDataAccess()
+    state.grid = MockGrid(
+        {"dcline": {"dcline_id": [1], "from_bus_id": [1], "to_bus_id": [2]}}
+    )
+    state.download_output_data()
+    fields = ["PG", "PF", "LMP", "CONGU", "CONGL", "AVERAGED_CONG", "PF_DCLINE"]
+    assert requests == [("1", fields)]
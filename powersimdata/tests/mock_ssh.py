@@ -1,23 +1,71 @@
-import shutil
-from contextlib import contextmanager
+import io
+import os
 from subprocess import PIPE, Popen
 
 
+class MockSFTPFile(io.FileIO):
+    def __init__(self, path, mode="r"):
+        super().__init__(path, mode.replace("b", ""))
+
+    def prefetch(self, file_size=None):
+        pass
+
+    def set_pipelined(self, pipelined=True):
+        pass
+
+    def stat(self):
+        return os.fstat(self.fileno())
+
+
+class MockChannelFile:
+    """Mimic paramiko's channel files: bytes from read, str from readlines."""
+
+    def __init__(self, pipe):
+        self.pipe = pipe
+
+    def read(self, size=-1):
+        return self.pipe.read(size)
+
+    def readline(self):
+        return self.pipe.readline().decode()
+
+    def readlines(self):
+        return [line.decode() for line in self.pipe.readlines()]
+
+    def write(self, data):
+        self.pipe.write(data.encode() if isinstance(data, str) else data)
+
+    def flush(self):
+        self.pipe.flush()
+
+    def close(self):
+        self.pipe.close()
+
+
 class MockConnection:
-    @contextmanager
     def open_sftp(self):
-        yield self
+        return self
 
-    def get(self, from_path, to_path, callback=None):
-        shutil.copy(from_path, to_path)
+    def open(self, path, mode="r"):
+        return MockSFTPFile(path, mode)
 
-    def put(self, from_path, to_path):
-        shutil.copy(from_path, to_path)
+    def stat(self, path):
+        return os.stat(path)
 
-    def exec_command(self, command):
+    def exec_command(self, command, timeout=None):
         print(command)
-        proc = Popen(command, shell=True, stderr=PIPE)
-        return None, None, proc.stderr
+        proc = Popen(
+            command,
+            shell=True,
+            executable="/bin/bash",
+            stdin=PIPE,
+            stdout=PIPE,
+            stderr=PIPE,
+        )
+        return tuple(MockChannelFile(p) for p in (proc.stdin, proc.stdout, proc.stderr))
+
+    def get_transport(self):
+        return None
 
     def close(self):
         pass